@@ -14,20 +14,108 @@ Status: Development
 
 import sys
 import os
+from collections import defaultdict
+from functools import partial
 from converters.geojson_to_svg import geojson_to_svg  # Import your SVG converter
 from gui.svg_editor import EditableSVG  # Import svg_editor correctly
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QLabel, QPushButton, QFileDialog,
-    QWidget, QMessageBox, QToolBar, QStackedWidget, QListWidget, QGridLayout, QListWidget, QHBoxLayout
+    QWidget, QMessageBox, QToolBar, QGridLayout, QListView, QHBoxLayout
 )
 from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QUrl, QObject, QThread, QTimer, Signal, QAbstractListModel, QModelIndex
+
+_GEOJSON_EXT = ".geojson"
+
+_EDITOR_TOOLBAR_QSS = """
+    QToolBar {
+        background-color: #2E2E2E;
+        spacing: 8px;
+        padding: 5px;
+    }
+    QToolButton {
+        color: white;
+        padding: 5px;
+    }
+"""
+
+
+class ConvertWorker(QObject):
+    """Runs the GeoJSON-to-SVG conversion off the GUI thread."""
+
+    finished = Signal(str)
+    error = Signal(str)
 
-class DragDropListWidget(QListWidget):
+    def __init__(self, file_paths, output_file):
+        super().__init__()
+        self.file_paths = file_paths
+        self.output_file = output_file
+
+    def run(self):
+        try:
+            geojson_to_svg(
+                self.file_paths["Lots"],
+                self.file_paths["Grass"],
+                self.file_paths["Water"],
+                self.file_paths["Road"],
+                self.output_file
+            )
+        except Exception as e:
+            self.error.emit(str(e))
+        else:
+            self.finished.emit(self.output_file)
+
+
+class FilePathsModel(QAbstractListModel):
+    """List model backed directly by a MainWindow file-path list.
+
+    Avoids the per-row QListWidgetItem allocation and the double storage of
+    keeping paths in both the widget and file_paths.
+    """
+
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self._paths = paths  # shared with MainWindow.file_paths[file_type]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._paths[index.row()]
+        return None
+
+    def add_paths(self, paths):
+        """Append paths in one insert so the view lays out once."""
+        if paths:
+            first = len(self._paths)
+            self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+            self._paths.extend(paths)
+            self.endInsertRows()
+
+    def remove_rows(self, rows):
+        """Remove rows (given in descending order) and return the popped paths."""
+        removed = []
+        for row in rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            removed.append(self._paths.pop(row))
+            self.endRemoveRows()
+        return removed
+
+
+class DragDropListView(QListView):
     def __init__(self, parent_window, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setAcceptDrops(True)
         self.parent_window = parent_window  # Store reference to MainWindow
+        self.setSelectionMode(QListView.ExtendedSelection)
+
+        # Rows are all plain one-line paths: uniform sizes plus batched layout
+        # keep relayout cost proportional to visible rows, not total items
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(64)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -40,12 +128,20 @@ class DragDropListWidget(QListWidget):
     def dropEvent(self, event):
         """Handle the file drop event."""
         if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith(".geojson"):  # Ensure only GeoJSON files are added
-                    self.addItem(file_path)  # Add file path to the list widget
-                    self.parent_window.file_paths[self.objectName()].append(file_path)  # Store file path
-            self.parent_window.check_run_conditions()  # Ensure Run button updates
+            # Cache the lookups once, then filter in comprehensions: extract
+            # local paths, keep .geojson files not already listed
+            seen = self.parent_window.file_path_sets[self.objectName()]
+            splitext = os.path.splitext
+            local_paths = [url.toLocalFile() for url in event.mimeData().urls()]
+            new_paths = [
+                path for path in local_paths
+                if splitext(path)[1].lower() == _GEOJSON_EXT and path not in seen
+            ]
+            if new_paths:
+                seen.update(new_paths)
+                # One model insert per drop instead of one item per file
+                self.model().add_paths(new_paths)
+            self.parent_window.schedule_run_check()  # Ensure Run button updates
 
 
 class MainWindow(QMainWindow):
@@ -55,28 +151,48 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Platmap Pro")
         self.setGeometry(100, 100, 700, 400)
 
-        # Store file paths
+        # Store file paths, with a parallel set per type for O(1) duplicate checks
         self.file_paths = {"Lots": [], "Grass": [], "Water": [], "Road": []}
+        self.file_path_sets = {file_type: set() for file_type in self.file_paths}
+
+        # Reuse one dialog per direction; repeated construction re-initializes
+        # the platform dialog and loses directory history
+        self._open_dialog = QFileDialog(self)
+        self._open_dialog.setNameFilter("GeoJSON Files (*.geojson);;All Files (*)")
+        self._open_dialog.setFileMode(QFileDialog.ExistingFiles)
+
+        self._save_dialog = QFileDialog(self)
+        self._save_dialog.setNameFilter("SVG Files (*.svg);;All Files (*)")
+        self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+        self._save_dialog.setWindowTitle("Select Output File")
         self.output_file = None
+        self._run_check_pending = False
 
-        # Initialize SVG Editor with reference to MainWindow
-        self.svg_editor = EditableSVG(None, None)
-        self.svg_editor.parent_window = self  # Provide reference to MainWindow
+        # Cache the available screen size; availableGeometry is a window-system
+        # round trip, so refresh it only when it actually changes (taskbar/dock
+        # resizes included), re-hooking if the primary screen is swapped
+        self._max_width = self._max_height = 0
+        self._screen = None
+        self._watch_screen(QApplication.primaryScreen())
+        QApplication.instance().primaryScreenChanged.connect(self._watch_screen)
+
+        # SVG editor is built lazily on first use; see switch_context
+        self.svg_editor = None
+        self.svg_editor_context = None
 
         # Toolbar
         self.init_toolbar()
 
-        # Central widget
-        self.central_widget = QStackedWidget()
+        # Central container; with only two contexts, plain show/hide avoids
+        # the stacked widget's index tracking and signal plumbing
+        self.central_widget = QWidget()
+        self.central_layout = QVBoxLayout(self.central_widget)
+        self.central_layout.setContentsMargins(0, 0, 0, 0)
         self.setCentralWidget(self.central_widget)
 
         # Main Context
         self.main_context = self.create_main_context()
-        self.central_widget.addWidget(self.main_context)
-
-        # SVG Editor Context
-        self.svg_editor_context = self.create_svg_editor_context()
-        self.central_widget.addWidget(self.svg_editor_context)
+        self.central_layout.addWidget(self.main_context)
 
     def init_toolbar(self):
         """Initialize the toolbar."""
@@ -86,17 +202,30 @@ class MainWindow(QMainWindow):
 
         # New Map Action
         new_map_action = QAction("Create new map", self)
-        new_map_action.triggered.connect(lambda: self.switch_context(0))
+        new_map_action.triggered.connect(partial(self.switch_context, 0))
         toolbar.addAction(new_map_action)
 
         # SVG Editor Action
         svg_editor_action = QAction("Open SVG Editor", self)
-        svg_editor_action.triggered.connect(lambda: self.switch_context(1))
+        svg_editor_action.triggered.connect(partial(self.switch_context, 1))
         toolbar.addAction(svg_editor_action)
 
     def switch_context(self, index):
         """Switch between main context and SVG editor context."""
-        self.central_widget.setCurrentIndex(index)
+        if index == 1 and self.svg_editor is None:
+            # Defer the editor's construction until it is first opened so
+            # startup only pays for the main context
+            self.svg_editor = EditableSVG(None, None)
+            self.svg_editor.parent_window = self  # Provide reference to MainWindow
+            self.svg_editor_context = self.create_svg_editor_context()
+            self.central_layout.addWidget(self.svg_editor_context)
+        if index == 0:
+            if self.svg_editor_context is not None:
+                self.svg_editor_context.hide()
+            self.main_context.show()
+        else:
+            self.main_context.hide()
+            self.svg_editor_context.show()
 
     def create_main_context(self):
         """Create the main context with file selection and run button."""
@@ -110,6 +239,10 @@ class MainWindow(QMainWindow):
 
         # File Sections
         self.file_list_widgets = {}
+        self.file_models = {
+            file_type: FilePathsModel(paths, self)
+            for file_type, paths in self.file_paths.items()
+        }
 
         for file_type in ["Lots", "Grass", "Water", "Road"]:
             section_layout = self.create_file_section(file_type)
@@ -141,8 +274,9 @@ class MainWindow(QMainWindow):
         section_layout.addWidget(section_label)
 
         # Drag and Drop List
-        file_list = DragDropListWidget(self)
+        file_list = DragDropListView(self)
         file_list.setObjectName(file_type)
+        file_list.setModel(self.file_models[file_type])
         self.file_list_widgets[file_type] = file_list
         section_layout.addWidget(file_list)
 
@@ -150,11 +284,11 @@ class MainWindow(QMainWindow):
         button_layout = QHBoxLayout()
         
         add_button = QPushButton(f"Add {file_type} Files")
-        add_button.clicked.connect(lambda: self.add_files(file_type))
+        add_button.clicked.connect(partial(self.add_files, file_type))
         button_layout.addWidget(add_button)
 
         remove_button = QPushButton(f"Remove {file_type} Files")
-        remove_button.clicked.connect(lambda: self.remove_files(file_type))
+        remove_button.clicked.connect(partial(self.remove_files, file_type))
         button_layout.addWidget(remove_button)
 
         section_layout.addLayout(button_layout)
@@ -164,62 +298,59 @@ class MainWindow(QMainWindow):
     def create_file_input(self, layout, label_text, row):
         """Create a file input row in the grid."""
         add_button = QPushButton(f"Add {label_text} Files")
-        add_button.clicked.connect(lambda: self.add_files(label_text))
+        add_button.clicked.connect(partial(self.add_files, label_text))
         layout.addWidget(add_button, row, 0)
 
         remove_button = QPushButton(f"Remove {label_text} Files")
-        remove_button.clicked.connect(lambda: self.remove_files(label_text))
+        remove_button.clicked.connect(partial(self.remove_files, label_text))
         layout.addWidget(remove_button, row, 1)
 
     def add_files(self, file_type):
         """Add files for the given file type."""
-        file_dialog = QFileDialog()
-        file_paths, _ = file_dialog.getOpenFileNames(
-            self, f"Select {file_type} Files", "", "GeoJSON Files (*.geojson);;All Files (*)"
-        )
+        self._open_dialog.setWindowTitle(f"Select {file_type} Files")
+        file_paths = self._open_dialog.selectedFiles() if self._open_dialog.exec() else []
         if file_paths:
-            self.file_paths[file_type].extend(file_paths)
-            self.update_file_list(file_type)
+            seen = self.file_path_sets[file_type]
+            new_paths = [path for path in file_paths if path not in seen]
+            seen.update(new_paths)
+            self.file_models[file_type].add_paths(new_paths)
+            self.schedule_run_check()
 
     def remove_files(self, file_type):
         """Remove selected files from the list."""
-        widget = self.file_list_widgets[file_type]
-        selected_items = widget.selectedItems()
-        
-        for item in selected_items:
-            self.file_paths[file_type].remove(item.text())
-            widget.takeItem(widget.row(item))  # Remove from UI
-
-        self.check_run_conditions()  # Ensure Run button is updated
+        view = self.file_list_widgets[file_type]
 
-    def update_file_list(self, file_type):
-        """Update the file list widget for the given file type, preventing duplicates."""
-        widget = self.file_list_widgets[file_type]
-        widget.clear()
-        
-        # Ensure each file is listed only once
-        unique_files = list(set(self.file_paths[file_type]))
-        self.file_paths[file_type] = unique_files  # Remove duplicates
-        widget.addItems(unique_files)
+        # Pop by row index, highest first, so earlier rows keep their indices
+        # and no O(n) list.remove scans are needed
+        rows = sorted(
+            (index.row() for index in view.selectionModel().selectedRows()), reverse=True
+        )
+        removed = self.file_models[file_type].remove_rows(rows)
+        self.file_path_sets[file_type].difference_update(removed)
 
-        self.check_run_conditions()  # Ensure Run button is enabled when conditions are met
+        self.schedule_run_check()  # Ensure Run button is updated
 
     def select_output_file(self):
         """Select the output file."""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getSaveFileName(
-            self, "Select Output File", "", "SVG Files (*.svg);;All Files (*)"
-        )
+        selected = self._save_dialog.selectedFiles() if self._save_dialog.exec() else []
+        file_path = selected[0] if selected else None
         if file_path:
             self.output_file = file_path
             self.output_file_label.setText(f"Selected output file: {file_path}")
         else:
             self.output_file = None
             self.output_file_label.setText("No output file selected.")
-        self.check_run_conditions()
+        self.schedule_run_check()
+
+    def schedule_run_check(self):
+        """Coalesce run-condition checks so a burst of mutations evaluates once."""
+        if not self._run_check_pending:
+            self._run_check_pending = True
+            QTimer.singleShot(0, self.check_run_conditions)
 
     def check_run_conditions(self):
         """Enable the run button if conditions are met."""
+        self._run_check_pending = False
         lots_files_selected = bool(self.file_paths["Lots"])
         output_file_selected = bool(self.output_file)
         self.run_button.setEnabled(lots_files_selected and output_file_selected)
@@ -227,22 +358,51 @@ class MainWindow(QMainWindow):
     def run_conversion(self):
         """Run the conversion process."""
         try:
-            # Check if files exist
-            for file_type, paths in self.file_paths.items():
-                for path in paths:
-                    if not os.path.exists(path):
-                        raise FileNotFoundError(f"File not found: {path}")
-
-            geojson_to_svg(
-                self.file_paths["Lots"],
-                self.file_paths["Grass"],
-                self.file_paths["Water"],
-                self.file_paths["Road"],
-                self.output_file
-            )
-            QMessageBox.information(self, "Success", f"SVG file created: {self.output_file}")
+            # Check if files exist, one scandir per directory instead of one
+            # stat syscall per file
+            all_paths = [path for paths in self.file_paths.values() for path in paths]
+            dirs = defaultdict(set)
+            for directory, name in map(os.path.split, all_paths):
+                dirs[directory].add(name)
+            for directory, names in dirs.items():
+                try:
+                    present = {entry.name for entry in os.scandir(directory)}
+                except OSError:
+                    present = set()
+                missing = names - present
+                if missing:
+                    raise FileNotFoundError(
+                        f"File not found: {os.path.join(directory, sorted(missing)[0])}"
+                    )
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred:\n{str(e)}")
+            return
+
+        # Run the conversion on a worker thread so the event loop keeps painting
+        self.run_button.setEnabled(False)
+        self._convert_thread = QThread(self)
+        self._convert_worker = ConvertWorker(
+            {file_type: list(paths) for file_type, paths in self.file_paths.items()},
+            self.output_file,
+        )
+        self._convert_worker.moveToThread(self._convert_thread)
+        self._convert_thread.started.connect(self._convert_worker.run)
+        self._convert_worker.finished.connect(self.on_conversion_finished)
+        self._convert_worker.error.connect(self.on_conversion_error)
+        self._convert_worker.finished.connect(self._convert_thread.quit)
+        self._convert_worker.error.connect(self._convert_thread.quit)
+        self._convert_thread.finished.connect(self._convert_thread.deleteLater)
+        self._convert_thread.start()
+
+    def on_conversion_finished(self, output_file):
+        """Re-enable the Run button and report success."""
+        self.check_run_conditions()
+        QMessageBox.information(self, "Success", f"SVG file created: {output_file}")
+
+    def on_conversion_error(self, message):
+        """Re-enable the Run button and report the conversion failure."""
+        self.check_run_conditions()
+        QMessageBox.critical(self, "Error", f"An error occurred:\n{message}")
 
     def create_svg_editor_context(self):
         """Create the SVG editor context with a toolbar for buttons."""
@@ -252,17 +412,7 @@ class MainWindow(QMainWindow):
         # Create a toolbar for the SVG editor actions
         editor_toolbar = QToolBar("SVG Editor Tools", self)
         editor_toolbar.setMovable(False)
-        editor_toolbar.setStyleSheet("""
-            QToolBar {
-                background-color: #2E2E2E;
-                spacing: 8px;
-                padding: 5px;
-            }
-            QToolButton {
-                color: white;
-                padding: 5px;
-            }
-        """)
+        editor_toolbar.setStyleSheet(_EDITOR_TOOLBAR_QSS)
 
         # Add actions to the toolbar
         save_action = QAction("Save Changes", self)
@@ -284,18 +434,29 @@ class MainWindow(QMainWindow):
         container.setLayout(layout)
         return container
     
+    def _watch_screen(self, screen):
+        """Follow the primary screen's available geometry, re-hooking on swaps."""
+        if self._screen is not None:
+            self._screen.availableGeometryChanged.disconnect(self.refresh_screen_geometry)
+        self._screen = screen
+        screen.availableGeometryChanged.connect(self.refresh_screen_geometry)
+        self.refresh_screen_geometry()
+
+    def refresh_screen_geometry(self, available=None):
+        """Cache the available screen size for resize_to_svg."""
+        if available is None:
+            available = self._screen.availableGeometry()
+        self._max_width = available.width()
+        self._max_height = available.height()
+
     def resize_to_svg(self, width, height):
         """Resize the main window to fit the dimensions of the SVG."""
         # Add some padding to the dimensions for better visibility
         width += 50
         height += 50
 
-        # Set a maximum size limit to avoid over-scaling on extremely large SVGs
-        screen_geometry = QApplication.primaryScreen().availableGeometry()
-        max_width = screen_geometry.width()
-        max_height = screen_geometry.height()
-
-        self.resize(min(width, max_width), min(height, max_height))
+        # Cap at the cached screen size to avoid over-scaling on extremely large SVGs
+        self.resize(min(width, self._max_width), min(height, self._max_height))
 
 
 if __name__ == "__main__":
@@ -1,17 +1,20 @@
 from PySide6.QtWidgets import (
     QApplication, QGraphicsView, QGraphicsScene, QGraphicsEllipseItem,
     QVBoxLayout, QPushButton, QDialog, QGraphicsPathItem, QMessageBox,
-    QFileDialog, QSizePolicy, QHBoxLayout, QWidget
+    QFileDialog, QSizePolicy, QHBoxLayout, QWidget, QGraphicsPixmapItem
 )
-from PySide6.QtGui import QColor, QPainterPath, QPen, QBrush
-from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QBrush, QPolygonF, QSurfaceFormat, QPixmap
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
+from PySide6.QtCore import Qt, QRectF, QPointF, QTimer
 from PySide6.QtWidgets import QGraphicsItem
 from svg.path import Line, CubicBezier, Move, Close
-from shapely.geometry import Point, Polygon
-import xml.etree.ElementTree as ET
+from collections import namedtuple
+from functools import lru_cache
+import re
+from lxml import etree as ET
+import numpy as np
 import sys
 import svg.path as svg_path
-import xml.dom.minidom as minidom
 
 
 
@@ -22,15 +25,38 @@ class CustomGraphicsView(QGraphicsView):
         self.zoom_factor = 0.1  # Incremental zoom factor
         self.setDragMode(QGraphicsView.RubberBandDrag)  # Enable rubber band drag for multi-selection
         self.original_transform = self.transform()  # Save the original transform for resetting
+        self._wheel_accum = 0.0  # Wheel delta gathered since the last applied zoom
+        self._wheel_pending = False
+        self.zoom_callback = None  # Invoked after each applied zoom step
+
+        # GPU-backed viewport: pan/zoom repaints become vertex work instead
+        # of a full CPU re-rasterization per frame
+        surface_format = QSurfaceFormat()
+        surface_format.setSamples(4)
+        gl_viewport = QOpenGLWidget()
+        gl_viewport.setFormat(surface_format)
+        self.setViewport(gl_viewport)
+        self.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
 
     def wheelEvent(self, event):
         """Zoom in/out smoothly with the mouse wheel."""
-        delta = event.angleDelta().y() / 120  # Standard mouse wheel step is 120
-        factor = 1 + self.zoom_factor * delta
+        # Coalesce bursts of wheel events into one scale() per frame so fast
+        # trackpads don't trigger a full repaint per delta
+        self._wheel_accum += event.angleDelta().y() / 120  # Standard mouse wheel step is 120
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            QTimer.singleShot(16, self._apply_wheel)
+
+    def _apply_wheel(self):
+        """Apply the accumulated wheel delta as a single zoom step."""
+        factor = (1 + self.zoom_factor) ** self._wheel_accum
+        self._wheel_accum = 0.0
+        self._wheel_pending = False
 
-        # Apply zoom transformation
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.scale(factor, factor)
+        if self.zoom_callback is not None:
+            self.zoom_callback()
 
     def keyPressEvent(self, event):
         """Enable panning when the spacebar is pressed or reset the view on Escape."""
@@ -39,6 +65,8 @@ class CustomGraphicsView(QGraphicsView):
         elif event.key() == Qt.Key_Escape:
             # Reset the view to the initial state
             self.setTransform(self.original_transform)  # Reset the zoom and pan
+            if self.zoom_callback is not None:
+                self.zoom_callback()
             self.setDragMode(QGraphicsView.RubberBandDrag)  # Restore drag mode
             self.scene().clearSelection()  # Clear any selections
         else:
@@ -52,6 +80,241 @@ class CustomGraphicsView(QGraphicsView):
             super().keyReleaseEvent(event)
 
 
+# One record per editable lot group; attribute access on a namedtuple is
+# faster than index unpacking and reads better at the call sites
+DotGroup = namedtuple("DotGroup", ["dot", "circle", "text", "polygon", "path", "path_item"])
+
+def _points_in_polygon(polygon_pts, xs, ys):
+    """Crossing-number point-in-polygon test, vectorized over query points.
+
+    Cheaper than building a GEOS polygon per lot just to test four corner
+    candidates; degenerate zero-length edges drop out of the crossing mask.
+    """
+    x1 = polygon_pts[:, 0]
+    y1 = polygon_pts[:, 1]
+    x2 = np.roll(x1, -1)
+    y2 = np.roll(y1, -1)
+    xq = xs[:, None]
+    yq = ys[:, None]
+    crosses = (y1 > yq) != (y2 > yq)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_int = x1 + (yq - y1) * (x2 - x1) / (y2 - y1)
+    return ((crosses & (xq < x_int)).sum(axis=1) % 2).astype(bool)
+
+
+# Namespace-qualified tag constants: element.find/iter with a literal
+# qualified tag skips the XPath compile and namespace-dict lookup entirely
+_SVG_NS = "http://www.w3.org/2000/svg"
+_TAG_G = f"{{{_SVG_NS}}}g"
+_TAG_PATH = f"{{{_SVG_NS}}}path"
+_TAG_CIRCLE = f"{{{_SVG_NS}}}circle"
+_TAG_TEXT = f"{{{_SVG_NS}}}text"
+_TAG_POLYGON = f"{{{_SVG_NS}}}polygon"
+
+_pen_cache = {}
+_brush_cache = {}
+
+
+def _get_pen(color):
+    """Return a shared QPen for a color string, parsing it at most once."""
+    pen = _pen_cache.get(color)
+    if pen is None:
+        pen = _pen_cache[color] = QPen(QColor(color))
+    return pen
+
+
+def _get_brush(color):
+    """Return a shared QBrush for a color string, parsing it at most once."""
+    brush = _brush_cache.get(color)
+    if brush is None:
+        brush = _brush_cache[color] = QBrush(QColor(color))
+    return brush
+
+
+_NUMBER_RE = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
+
+@lru_cache(maxsize=4096)
+def _path_to_xy(d_attr):
+    """Extract the coordinate pairs of a d string as an (N, 2) float array.
+
+    Converter output uses absolute verbs, where every number is half of a
+    coordinate pair, so one regex sweep replaces the svg.path walk; paths
+    with relative verbs fall back to the parsed segments, which resolve
+    them to absolute coordinates.
+    """
+    has_relative = any(c.isalpha() and c.islower() and c not in "e" for c in d_attr)
+    if not has_relative:
+        numbers = _NUMBER_RE.findall(d_attr)
+        if numbers and len(numbers) % 2 == 0:
+            return np.array(numbers, dtype=np.float64).reshape(-1, 2)
+
+    points = []
+    append = points.append
+    for segment in _parse_path(d_attr):
+        if isinstance(segment, (Line, Move, Close)):
+            append(segment.start)
+            append(segment.end)
+        elif isinstance(segment, CubicBezier):
+            append(segment.start)
+            append(segment.end)
+            append(segment.control1)
+            append(segment.control2)
+    return np.fromiter(
+        points, dtype=complex, count=len(points)
+    ).view(np.float64).reshape(-1, 2)
+
+
+@lru_cache(maxsize=4096)
+def _parse_path(d_attr):
+    """Parse a d string once per unique value; identical house icons repeat
+    across lots, so the cache collapses most parses to lookups."""
+    return tuple(svg_path.parse_path(d_attr))
+
+
+_painter_path_cache = {}
+
+
+def _flush_polyline(painter_path, run):
+    """Append a pending Move/Line run to the path as one bulk polygon."""
+    if not run:
+        return
+    if len(run) == 1:
+        painter_path.moveTo(run[0][0], run[0][1])
+    else:
+        painter_path.addPolygon(QPolygonF([QPointF(x, y) for x, y in run]))
+    run.clear()
+
+
+def _flatten_cubic(ax, ay, bx, by, cx, cy, dx, dy, tol=0.5):
+    """Adaptively flatten a cubic Bezier with iterative De Casteljau splits.
+
+    Returns the polyline points after the start point. Subdivision stops once
+    both control points sit within tol of the chord, so flat curves cost two
+    points and tight ones get more.
+    """
+    points = []
+    stack = [(ax, ay, bx, by, cx, cy, dx, dy)]
+    flat_limit = 16.0 * tol * tol
+    while stack:
+        ax, ay, bx, by, cx, cy, dx, dy = stack.pop()
+        ux = 3.0 * bx - 2.0 * ax - dx
+        uy = 3.0 * by - 2.0 * ay - dy
+        vx = 3.0 * cx - ax - 2.0 * dx
+        vy = 3.0 * cy - ay - 2.0 * dy
+        if max(ux * ux, vx * vx) + max(uy * uy, vy * vy) <= flat_limit:
+            points.append((dx, dy))
+        else:
+            abx = (ax + bx) * 0.5
+            aby = (ay + by) * 0.5
+            bcx = (bx + cx) * 0.5
+            bcy = (by + cy) * 0.5
+            cdx = (cx + dx) * 0.5
+            cdy = (cy + dy) * 0.5
+            abcx = (abx + bcx) * 0.5
+            abcy = (aby + bcy) * 0.5
+            bcdx = (bcx + cdx) * 0.5
+            bcdy = (bcy + cdy) * 0.5
+            mx = (abcx + bcdx) * 0.5
+            my = (abcy + bcdy) * 0.5
+            stack.append((mx, my, bcdx, bcdy, cdx, cdy, dx, dy))
+            stack.append((ax, ay, abx, aby, abcx, abcy, mx, my))
+    return points
+
+
+def _build_painter_path(d_attr, parsed_path=None):
+    """Build a QPainterPath for a d string, cached so identical house icons
+    across lots are only assembled once.
+
+    Pure-polyline runs go through one addPolygon call instead of a
+    Python-to-C++ transition per segment; curves are pre-flattened to
+    polylines so Qt never re-tessellates them on repaint.
+    """
+    cached = _painter_path_cache.get(d_attr)
+    if cached is not None:
+        return cached
+
+    if parsed_path is None:
+        parsed_path = _parse_path(d_attr)
+
+    painter_path = QPainterPath()
+    run = []
+    for element in parsed_path:
+        if isinstance(element, Move):
+            _flush_polyline(painter_path, run)
+            run.append((element.start.real, element.start.imag))
+        elif isinstance(element, Line):
+            if not run:
+                run.append((element.start.real, element.start.imag))
+            run.append((element.end.real, element.end.imag))
+        elif isinstance(element, CubicBezier):
+            if not run:
+                run.append((element.start.real, element.start.imag))
+            run.extend(_flatten_cubic(
+                element.start.real, element.start.imag,
+                element.control1.real, element.control1.imag,
+                element.control2.real, element.control2.imag,
+                element.end.real, element.end.imag,
+            ))
+    _flush_polyline(painter_path, run)
+
+    _painter_path_cache[d_attr] = painter_path
+    return painter_path
+
+
+def _fmt(value):
+    """Format a coordinate with two decimals; screen dots need no more, and
+    the shorter numbers shrink the saved SVG."""
+    return f"{value:.2f}"
+
+
+# %-formatting reaches C float formatting directly, without the f-string
+# format-spec machinery; bound __mod__ skips an attribute lookup per segment
+_FMT_M = "M%g,%g".__mod__
+_FMT_L = "L%g,%g".__mod__
+_FMT_C = "C%g,%g %g,%g %g,%g".__mod__
+
+
+def _translate_d(segments, dx, dy):
+    """Emit a translated d string from cached segment tuples; no re-parse."""
+    adjusted_d = []
+    append = adjusted_d.append
+    for segment in segments:
+        kind = segment[0]
+        if kind == "M":
+            append(_FMT_M((segment[1] + dx, segment[2] + dy)))
+        elif kind == "L":
+            append(_FMT_L((segment[1] + dx, segment[2] + dy)))
+        elif kind == "C":
+            append(_FMT_C((segment[1] + dx, segment[2] + dy,
+                           segment[3] + dx, segment[4] + dy,
+                           segment[5] + dx, segment[6] + dy)))
+        else:
+            append("Z")
+    return " ".join(adjusted_d)
+
+
+def _segment_tuples(parsed_path):
+    """Flatten parsed svg.path segments into plain float tuples for fast reuse.
+
+    Moves and lines are kept as distinct commands so connected subpaths stay
+    connected when re-emitted; only a Move starts a new subpath.
+    """
+    segments = []
+    for element in parsed_path:
+        if isinstance(element, Move):
+            segments.append(("M", element.end.real, element.end.imag))
+        elif isinstance(element, Line):
+            segments.append(("L", element.end.real, element.end.imag))
+        elif isinstance(element, CubicBezier):
+            segments.append(("C", element.control1.real, element.control1.imag,
+                             element.control2.real, element.control2.imag,
+                             element.end.real, element.end.imag))
+        elif isinstance(element, Close):
+            segments.append(("Z",))
+    return segments
+
+
 class SelectableDot(QGraphicsEllipseItem):
     """Custom QGraphicsEllipseItem to support linked movement with house icons and other elements."""
     def __init__(self, rect, path_item=None, text_item=None, polygon_item=None):
@@ -60,55 +323,47 @@ class SelectableDot(QGraphicsEllipseItem):
         self.text_item = text_item  # Text (e.g., lot number)
         self.polygon_item = polygon_item  # Star (lotPremium)
 
-    def itemChange(self, change, value):
-        """Ensure that all linked elements move when the dot moves."""
-        if change == QGraphicsItem.ItemPositionChange:
-            dx = value.x() - self.sceneBoundingRect().center().x()
-            dy = value.y() - self.sceneBoundingRect().center().y()
-
-            if self.path_item:
-                d_attr = self.path_item.path().elementAt(0)  # Get current path
-                try:
-                    parsed_path = svg_path.parse_path(d_attr)
-                    adjusted_d = []
-
-                    for element in parsed_path:
-                        if isinstance(element, (Move, Line)):
-                            adjusted_d.append(f"M{element.start.real + dx},{element.start.imag + dy}")
-                            adjusted_d.append(f"L{element.end.real + dx},{element.end.imag + dy}")
-
-                        elif isinstance(element, CubicBezier):
-                            adjusted_d.append(
-                                f"C{element.control1.real + dx},{element.control1.imag + dy} "
-                                f"{element.control2.real + dx},{element.control2.imag + dy} "
-                                f"{element.end.real + dx},{element.end.imag + dy}"
-                            )
-
-                    updated_path = " ".join(adjusted_d)
-                    self.path_item.setPath(updated_path)
-
-                except Exception as e:
-                    print(f"Error updating path in itemChange: {e}")
-
-
-            if self.text_item is not None:
-                transform_values = self.text_item.get("transform").split()
-                old_x = float(transform_values[-2])
-                old_y = float(transform_values[-1].replace(")", ""))
-
-                new_x = old_x + dx
-                new_y = old_y + dy
-                self.text_item.set("transform", f"matrix(1 0 0 1 {new_x} {new_y})")
-
-            if self.polygon_item is not None:
-                original_points = self.polygon_item.get("points").split()
-                adjusted_points = [
-                    f"{float(p.split(',')[0]) + dx},{float(p.split(',')[1]) + dy}"
-                    for p in original_points
-                ]
-                self.polygon_item.set("points", " ".join(adjusted_points))
+        # Typed copies of the linked SVG attributes, parsed once in
+        # load_groups; itemChange translates these floats instead of
+        # re-parsing the attribute strings on every mouse move
+        self.path_elem = None       # <path> element for the house icon
+        self.path_segments = None   # flattened segment tuples of floats
+        self.polygon_points = None  # [(x, y), ...] from the points attribute
+        self.text_origin = None     # (x, y) from the matrix transform
+
+    def mouseReleaseEvent(self, event):
+        """Sync linked SVG elements once per drag instead of once per pixel."""
+        super().mouseReleaseEvent(event)
+        self.sync_linked_elements()
+
+    def sync_linked_elements(self):
+        """Write the accumulated drag delta through to the linked SVG elements.
+
+        During the drag itself nothing is rebuilt: the house-icon path item is
+        a child of the dot, so Qt translates it for free, and the text/polygon
+        attributes only matter at save time.
+        """
+        # The dot starts at pos (0, 0), so its position is the total
+        # translation from the loaded coordinates; applying it against the
+        # cached originals avoids incremental drift
+        dx = self.pos().x()
+        dy = self.pos().y()
+        if dx == 0 and dy == 0:
+            return
+
+        if self.path_elem is not None and self.path_segments is not None:
+            self.path_elem.set("d", _translate_d(self.path_segments, dx, dy))
 
-        return super().itemChange(change, value)
+        if self.text_item is not None and self.text_origin is not None:
+            new_x = self.text_origin[0] + dx
+            new_y = self.text_origin[1] + dy
+            self.text_item.set("transform", f"matrix(1 0 0 1 {_fmt(new_x)} {_fmt(new_y)})")
+
+        if self.polygon_item is not None and self.polygon_points is not None:
+            new_pts = self.polygon_points + (dx, dy)
+            self.polygon_item.set(
+                "points", ("%g,%g " * len(new_pts) % tuple(new_pts.ravel())).rstrip()
+            )
 
 
 class EditableSVG(QDialog):
@@ -118,7 +373,12 @@ class EditableSVG(QDialog):
         self.output_file = output_file
 
         # Initialize attributes
-        self.groups = []  # List of (dot_item, circle_elem) pairs
+        self.groups = []  # List of DotGroup records
+        self._circle_to_dot = {}  # id(circle element) -> DotGroup
+        self._lot_circles = {}  # id(lot group) -> {status class: circle element}
+        self._dot_to_entry = {}  # SelectableDot -> DotGroup
+        self._static_items = []  # Vector items for the static lot outlines
+        self._static_pixmap_item = None  # Rasterized stand-in shown at far zoom
         self.svg_tree = None
         self.root = None
 
@@ -133,6 +393,13 @@ class EditableSVG(QDialog):
         # Graphics View for displaying SVG
         self.graphics_view = CustomGraphicsView(self)
         self.scene = QGraphicsScene(self)
+        # Dots are dragged constantly, so skip the BSP index bookkeeping and
+        # the per-paint state save/antialiasing adjustments
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.graphics_view.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
+        self.graphics_view.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
         self.graphics_view.setScene(self.scene)
         self.layout.addWidget(self.graphics_view)
 
@@ -243,10 +510,12 @@ class EditableSVG(QDialog):
     def zoom_in(self):
         """Zoom in on the map."""
         self.graphics_view.scale(1.2, 1.2)
+        self._update_static_layer()
 
     def zoom_out(self):
         """Zoom out on the map."""
         self.graphics_view.scale(0.8, 0.8)
+        self._update_static_layer()
 
     def load_svg(self, svg_file):
         """Load the SVG file into the editor."""
@@ -261,39 +530,23 @@ class EditableSVG(QDialog):
             # Adjust the scene with the viewBox and get dimensions
             width, height = self.setup_scene_viewbox()
 
-            # Render the SVG content onto the scene
-            self.render_static_svg()
-
-            # Load editable groups
-            self.load_groups()
+            # Render static content and load editable groups in one walk
+            self._build_scene()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load SVG file:\n{str(e)}")
 
     def auto_arrange_dots(self):
         """Automatically arrange dots at the corners of each lot's path shape."""
-        namespace = {"svg": "http://www.w3.org/2000/svg"}
-
-        for group_elem in self.root.findall(".//svg:g", namespace):
-            path_elem = group_elem.find("svg:path", namespace)
+        for group_elem in self.root.iter(_TAG_G):
+            path_elem = group_elem.find(_TAG_PATH)
             if path_elem is not None:
                 d_attr = path_elem.get("d")
-                parsed_path = svg_path.parse_path(d_attr)
-
-                # Extract all points from the path to create a polygon
-                path_points = []
-                for segment in parsed_path:
-                    if isinstance(segment, (Line, Move, Close)):
-                        path_points.append((segment.start.real, segment.start.imag))
-                        path_points.append((segment.end.real, segment.end.imag))
-                    elif isinstance(segment, CubicBezier):
-                        path_points.append((segment.start.real, segment.start.imag))
-                        path_points.append((segment.end.real, segment.end.imag))
-                        path_points.append((segment.control1.real, segment.control1.imag))
-                        path_points.append((segment.control2.real, segment.control2.imag))
-
-                lot_polygon = Polygon(path_points)
-                min_x, min_y, max_x, max_y = lot_polygon.bounds
+                # One tokenizer sweep yields the (K, 2) float array; bounds
+                # come from vectorized min/max
+                pts = _path_to_xy(d_attr)
+                min_x, min_y = pts.min(axis=0)
+                max_x, max_y = pts.max(axis=0)
                 inset = max((max_x - min_x) * 0.08, 10)
 
                 # Define corner positions with inset
@@ -304,32 +557,39 @@ class EditableSVG(QDialog):
                     (max_x - inset, max_y - inset),
                 ]
 
-                # Ensure dots are inside the polygon
+                # Ensure dots are inside the polygon: one vectorized
+                # crossing-number sweep, no GEOS geometry at all
+                corner_xs, corner_ys = np.asarray(corner_positions).T
+                inside = _points_in_polygon(pts, corner_xs, corner_ys)
                 valid_positions = [
-                    (cx, cy) for cx, cy in corner_positions if lot_polygon.contains(Point(cx, cy))
+                    corner_positions[i] for i in np.nonzero(inside)[0]
                 ]
 
                 # Assign dots to valid positions
                 dot_classes = ["constStatus", "lotPremium", "soldStatus"]
+                lot_map = self._lot_circles.get(id(group_elem), {})
                 for i, (cx, cy) in enumerate(valid_positions[:len(dot_classes)]):
                     dot_class = dot_classes[i]
-                    circle_elem = group_elem.find(f"svg:g[@class='{dot_class}']/svg:circle", namespace)
+                    circle_elem = lot_map.get(dot_class)
                     if circle_elem is not None:
-                        circle_elem.set("cx", str(cx))
-                        circle_elem.set("cy", str(cy))
-                        circle_elem.set("r", str(5))
-                        # Update the dot in the scene
-                        for dot, original_circle in self.groups:
-                            if original_circle == circle_elem:
-                                dot.setRect(cx - 5, cy - 5, 10, 10)
+                        circle_elem.set("cx", _fmt(cx))
+                        circle_elem.set("cy", _fmt(cy))
+                        circle_elem.set("r", "5")
+                        # Update the dot in the scene via the hash lookup
+                        entry = self._circle_to_dot.get(id(circle_elem))
+                        if entry is not None:
+                            entry.dot.setRect(cx - 5, cy - 5, 10, 10)
 
         self.scene.update()
         QMessageBox.information(self, "Auto Arrange", "Dots have been arranged automatically.")
 
     def swap_selected_dots(self):
         """Swap the physical positions of exactly two selected dots, keeping their color/class the same."""
-        # Get the selected items
-        selected_dots = [dot for dot, _ in self.groups if dot.isSelected()]
+        # The scene already tracks selection; the dot map then resolves each
+        # entry in O(1) instead of scanning self.groups
+        selected_dots = [
+            item for item in self.scene.selectedItems() if item in self._dot_to_entry
+        ]
 
         if len(selected_dots) != 2:
             QMessageBox.warning(self, "Swap Error", "Please select exactly two dots to swap.")
@@ -345,25 +605,13 @@ class EditableSVG(QDialog):
         dot2.setRect(pos1.x() - 5, pos1.y() - 5, 10, 10)
 
         # Update the corresponding SVG elements for only the two swapped dots
-        for dot, circle_elem in self.groups:
-            if dot == dot1:
-                circle_elem.set("cx", str(pos2.x()))
-                circle_elem.set("cy", str(pos2.y()))
-            elif dot == dot2:
-                circle_elem.set("cx", str(pos1.x()))
-                circle_elem.set("cy", str(pos1.y()))
-
-        # Redraw the scene to reflect the new positions
-        self.scene.removeItem(dot1)
-        self.scene.removeItem(dot2)
-
-        self.scene.addItem(dot1)
-        self.scene.addItem(dot2)
-
-        # Call update on the scene and dots
-        dot1.update()
-        dot2.update()
-        self.scene.update()
+        self._dot_to_entry[dot1].circle.set("cx", _fmt(pos2.x()))
+        self._dot_to_entry[dot1].circle.set("cy", _fmt(pos2.y()))
+        self._dot_to_entry[dot2].circle.set("cx", _fmt(pos1.x()))
+        self._dot_to_entry[dot2].circle.set("cy", _fmt(pos1.y()))
+
+        # setRect already notifies the scene of both changed regions; no
+        # remove/re-add churn or manual update calls are needed
 
     def setup_scene_viewbox(self):
         """Set up scene dimensions based on the SVG viewBox and resize the window accordingly."""
@@ -389,62 +637,58 @@ class EditableSVG(QDialog):
         self.graphics_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.resize(width + padding, height + padding)
 
-    def render_static_svg(self):
-        """Render static elements like paths, circles, and other shapes, excluding house icons."""
-        namespace = {"svg": "http://www.w3.org/2000/svg"}
-
-        # Find 'text' group to exclude
-        text_group = self.root.find(".//svg:g[@id='text']", namespace)
-        text_paths = set()
-
-        if text_group is not None:
-            for path_elem in text_group.findall(".//svg:path", namespace):
-                text_paths.add(path_elem)
-
-        # 🚨 Skip paths inside "soldStatus" groups (house icons)
-        for group in self.root.findall(".//svg:g[@class='soldStatus']", namespace):
-            for path in group.findall(".//svg:path", namespace):
-                text_paths.add(path)
-
-        # ✅ Render paths that are NOT in excluded sets
-        for path_elem in self.root.findall(".//svg:path", namespace):
-            if path_elem in text_paths:
-                continue  # Skip house icons & text paths
-
-            # Process and render the path
-            d_attr = path_elem.get("d")
-            if d_attr:
-                parsed_path = svg_path.parse_path(d_attr)
-                painter_path = QPainterPath()
-                for element in parsed_path:
-                    if isinstance(element, svg_path.Move):
-                        painter_path.moveTo(element.start.real, element.start.imag)
-                    elif isinstance(element, svg_path.Line):
-                        painter_path.lineTo(element.end.real, element.end.imag)
-                    elif isinstance(element, svg_path.CubicBezier):
-                        painter_path.cubicTo(
-                            element.control1.real, element.control1.imag,
-                            element.control2.real, element.control2.imag,
-                            element.end.real, element.end.imag,
-                        )
-                static_path_item = QGraphicsPathItem(painter_path)
-                static_path_item.setPen(QPen(QColor(path_elem.get("stroke", "#000000"))))
-                static_path_item.setBrush(QBrush(QColor(path_elem.get("fill", "transparent"))))
-                self.scene.addItem(static_path_item)
-
-    def load_groups(self):
-        """Load editable groups and visually distinguish them by color."""
-        namespace = {"svg": "http://www.w3.org/2000/svg"}
+    def _build_scene(self):
+        """Render static paths and load editable groups in one walk of the tree."""
         color_map = {"constStatus": "blue", "lotPremium": "red", "soldStatus": "green"}
         standard_radius = 5
 
-        for group in self.root.findall(".//svg:g", namespace):
-            class_attr = group.get("class")
-            if class_attr in color_map:
-                circle = group.find("svg:circle", namespace)
-                text = group.find("svg:text", namespace)
-                polygon = group.find("svg:polygon", namespace)
-                path = group.find(".//svg:path", namespace)  # Nested house icon path
+        self.groups = []
+        self._circle_to_dot = {}
+        self._dot_to_entry = {}
+        self._lot_circles = {}
+        self._static_items = []
+        self._static_pixmap_item = None
+        buckets = {}
+
+        # Depth-first walk with inherited excluded/stroke/fill state; replaces
+        # the separate static-render and group-load traversals, so text glyphs
+        # and "soldStatus" house icons are skipped without a membership set,
+        # and paint attributes hoisted onto ancestor groups by the converter
+        # still reach the style buckets
+        stack = [(self.root, False, "#000000", "transparent")]
+        while stack:
+            elem, excluded, stroke, fill = stack.pop()
+            tag = elem.tag
+            stroke = elem.get("stroke", stroke)
+            fill = elem.get("fill", fill)
+            if tag == _TAG_G:
+                if elem.get("id") == "text" or elem.get("class") == "soldStatus":
+                    excluded = True
+            elif tag == _TAG_PATH and not excluded:
+                d_attr = elem.get("d")
+                if d_attr:
+                    style = (stroke, fill)
+                    bucket = buckets.get(style)
+                    if bucket is None:
+                        bucket = buckets[style] = QPainterPath()
+                    bucket.addPath(_build_painter_path(d_attr))
+            stack.extend((child, excluded, stroke, fill) for child in elem)
+
+            if tag == _TAG_G and elem.get("class") in color_map:
+                # Classify the direct children in one pass instead of one
+                # tree query per element type
+                class_attr = elem.get("class")
+                group = elem
+                circle = text = polygon = None
+                for child in group:
+                    child_tag = child.tag
+                    if child_tag == _TAG_CIRCLE and circle is None:
+                        circle = child
+                    elif child_tag == _TAG_TEXT and text is None:
+                        text = child
+                    elif child_tag == _TAG_POLYGON and polygon is None:
+                        polygon = child
+                path = next(group.iter(_TAG_PATH), None)  # Nested house icon path
 
                 if circle is not None:
                     cx, cy = float(circle.get("cx")), float(circle.get("cy"))
@@ -467,24 +711,18 @@ class EditableSVG(QDialog):
                     if path is not None and path.get("data-processed") != "true":
                         d_attr = path.get("d", "")
                         try:
-                            parsed_path = svg_path.parse_path(d_attr)
-                            painter_path = QPainterPath()
-
-                            for element in parsed_path:
-                                if isinstance(element, svg_path.Move):
-                                    painter_path.moveTo(element.start.real, element.start.imag)
-                                elif isinstance(element, svg_path.Line):
-                                    painter_path.lineTo(element.end.real, element.end.imag)
-                                elif isinstance(element, svg_path.CubicBezier):
-                                    painter_path.cubicTo(
-                                        element.control1.real, element.control1.imag,
-                                        element.control2.real, element.control2.imag,
-                                        element.end.real, element.end.imag
-                                    )
+                            parsed_path = _parse_path(d_attr)
+                            dot.path_elem = path
+                            dot.path_segments = _segment_tuples(parsed_path)
+                            painter_path = _build_painter_path(d_attr, parsed_path)
 
                             path_item = QGraphicsPathItem(painter_path)
-                            path_item.setPen(QPen(QColor("#000000")))
-                            path_item.setBrush(QBrush(QColor("#000000")))
+                            path_item.setPen(_get_pen("#000000"))
+                            path_item.setBrush(_get_brush("#000000"))
+                            # Rasterize the icon once; dragging the parent dot
+                            # then blits the cached bitmap instead of
+                            # re-tessellating the path every frame
+                            path_item.setCacheMode(QGraphicsItem.ItemCoordinateCache)
                             path_item.setZValue(11)  # Ensure it renders above dots
                             path_item.setParentItem(dot)  # Attach to the dot
 
@@ -493,78 +731,125 @@ class EditableSVG(QDialog):
                         except Exception as e:
                             print(f"Error processing path in load_groups: {e}")
 
-                    # Store elements together so they move as a unit
-                    self.groups.append((dot, circle, text, polygon, path, path_item))
+                    # Cache typed copies of the linked attributes so drags
+                    # never re-parse the strings
+                    if text is not None and text.get("transform"):
+                        transform_values = text.get("transform").split()
+                        dot.text_item = text
+                        dot.text_origin = (
+                            float(transform_values[-2]),
+                            float(transform_values[-1].replace(")", "")),
+                        )
+                    if polygon is not None and polygon.get("points"):
+                        dot.polygon_item = polygon
+                        dot.polygon_points = np.array(
+                            polygon.get("points").replace(",", " ").split(),
+                            dtype=np.float64,
+                        ).reshape(-1, 2)
+
+                    # Store elements together so they move as a unit, with a
+                    # hash lookup from the circle element for O(1) access
+                    entry = DotGroup(dot, circle, text, polygon, path, path_item)
+                    self.groups.append(entry)
+                    self._circle_to_dot[id(circle)] = entry
+                    self._dot_to_entry[dot] = entry
+                    # Index the circle under its lot group so auto-arrange
+                    # resolves it with a dict lookup instead of predicate XPath
+                    lot_elem = group.getparent()
+                    if lot_elem is not None:
+                        self._lot_circles.setdefault(id(lot_elem), {})[class_attr] = circle
+
+        # ✅ Static paths merged into one compound item per (stroke, fill)
+        # style so the scene holds a handful of items instead of one per lot
+        for (stroke, fill), compound_path in buckets.items():
+            static_path_item = QGraphicsPathItem(compound_path)
+            static_path_item.setPen(_get_pen(stroke))
+            static_path_item.setBrush(_get_brush(fill))
+            # Rasterize each style bucket once per zoom level
+            static_path_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            self.scene.addItem(static_path_item)
+            self._static_items.append(static_path_item)
+
+        # At far zoom the static layer collapses to one textured blit
+        self.graphics_view.zoom_callback = self._update_static_layer
+        self._update_static_layer()
+
+    def _build_static_pixmap(self):
+        """Rasterize the static path buckets once into a scene-sized pixmap item."""
+        rect = self.scene.sceneRect()
+        pixmap = QPixmap(max(int(rect.width()), 1), max(int(rect.height()), 1))
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(-rect.x(), -rect.y())
+        for item in self._static_items:
+            painter.setPen(item.pen())
+            painter.setBrush(item.brush())
+            painter.drawPath(item.path())
+        painter.end()
+
+        pixmap_item = QGraphicsPixmapItem(pixmap)
+        pixmap_item.setPos(rect.x(), rect.y())
+        pixmap_item.setZValue(-1)  # Below the vector layer and the dots
+        self.scene.addItem(pixmap_item)
+        return pixmap_item
+
+    def _update_static_layer(self):
+        """Show the cached pixmap instead of the vector buckets at far zoom."""
+        if not self._static_items:
+            return
+
+        # Below this scale one scene unit is under half a device pixel, so
+        # vector detail no longer pays for the per-path repaint cost
+        use_pixmap = self.graphics_view.transform().m11() < 0.5
+        if use_pixmap and self._static_pixmap_item is None:
+            self._static_pixmap_item = self._build_static_pixmap()
+
+        if self._static_pixmap_item is not None:
+            self._static_pixmap_item.setVisible(use_pixmap)
+        for item in self._static_items:
+            item.setVisible(not use_pixmap)
 
     def save_changes(self):
         """Save updated positions of dots and associated elements (text, polygon, path) to the SVG file."""
-        svg_ns = "http://www.w3.org/2000/svg"
-        ET.register_namespace("", svg_ns)
-
         for dot, circle, text, polygon, path, path_item in self.groups:
             new_cx = dot.sceneBoundingRect().center().x()
             new_cy = dot.sceneBoundingRect().center().y()
 
-            old_cx = float(circle.get("cx"))
-            old_cy = float(circle.get("cy"))
-
-            dx = new_cx - old_cx
-            dy = new_cy - old_cy
-
-            circle.set("cx", str(new_cx))
-            circle.set("cy", str(new_cy))
-
-            if text is not None:
-                transform_values = text.get("transform").split()
-                old_x = float(transform_values[-2])
-                old_y = float(transform_values[-1].replace(")", ""))
-
-                new_x = old_x + dx
-                new_y = old_y + dy
-
-                text.set("transform", f"matrix(1 0 0 1 {new_x} {new_y})")
-
-            if polygon is not None:
-                original_points = polygon.get("points").split()
-                adjusted_points = [
-                    f"{float(p.split(',')[0]) + dx},{float(p.split(',')[1]) + dy}"
-                    for p in original_points
-                ]
-                polygon.set("points", " ".join(adjusted_points))
-
-            if path is not None:
-                d_attr = path.get("d", "")
-                try:
-                    parsed_path = svg_path.parse_path(d_attr)
-                    adjusted_d = []
-
-                    for element in parsed_path:
-                        if isinstance(element, Move):
-                            adjusted_d.append(f"M {element.start.real + dx},{element.start.imag + dy}")
-                        elif isinstance(element, Line):
-                            adjusted_d.append(f"L {element.end.real + dx},{element.end.imag + dy}")
-                        elif isinstance(element, CubicBezier):
-                            adjusted_d.append(
-                                f"C {element.control1.real + dx},{element.control1.imag + dy} "
-                                f"{element.control2.real + dx},{element.control2.imag + dy} "
-                                f"{element.end.real + dx},{element.end.imag + dy}"
-                            )
-                        elif isinstance(element, Close):
-                            adjusted_d.append("Z")  # Close path remains unchanged
-
-                    updated_path = " ".join(adjusted_d)
-                    path.set("d", updated_path)
-
-                except Exception as e:
-                    print(f"Error updating path in save_changes: {e}")
-
-        xml_str = ET.tostring(self.svg_tree.getroot(), encoding="utf-8").decode("utf-8")
-        parsed_xml = minidom.parseString(xml_str)
-        pretty_xml = parsed_xml.toprettyxml(indent="  ")
-        pretty_xml = "\n".join([line for line in pretty_xml.splitlines() if line.strip()])
-
-        with open(self.output_file, "w", encoding="utf-8") as f:
-            f.write(pretty_xml)
+            # The dot starts at pos (0, 0), so its position is the total drag
+            # delta; applying it against the originals cached in load_groups
+            # skips the parse round-trip and cannot drift
+            dx = dot.pos().x()
+            dy = dot.pos().y()
+
+            circle.set("cx", _fmt(new_cx))
+            circle.set("cy", _fmt(new_cy))
+
+            if dx == 0 and dy == 0:
+                continue  # untouched dot: linked elements are already correct
+
+            if text is not None and dot.text_origin is not None:
+                new_x = dot.text_origin[0] + dx
+                new_y = dot.text_origin[1] + dy
+                text.set("transform", f"matrix(1 0 0 1 {_fmt(new_x)} {_fmt(new_y)})")
+
+            if polygon is not None and dot.polygon_points is not None:
+                new_pts = dot.polygon_points + (dx, dy)
+                polygon.set(
+                    "points", ("%g,%g " * len(new_pts) % tuple(new_pts.ravel())).rstrip()
+                )
+
+            if path is not None and dot.path_segments is not None:
+                path.set("d", _translate_d(dot.path_segments, dx, dy))
+
+        # A tree parsed from disk keeps its original whitespace, so a
+        # same-file round-trip can skip the pretty-print pass entirely;
+        # only reindent when writing to a different destination
+        pretty = self.output_file != self.svg_file
+        self.svg_tree.write(
+            self.output_file, pretty_print=pretty, xml_declaration=True, encoding="utf-8"
+        )
 
         QMessageBox.information(self, "Success", f"Changes saved to {self.output_file}")
 
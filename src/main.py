@@ -16,12 +16,15 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 from gui.gui_main import MainWindow
 
-# Configure logging
+# Configure logging: keep dependencies at INFO so their debug-level calls
+# short-circuit, and enable DEBUG only for the app's own logger
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[logging.StreamHandler(sys.stdout)],
 )
+log = logging.getLogger("platmap_pro")
+log.setLevel(logging.DEBUG)
 
 # Resolve icon path
 project_root = Path(__file__).resolve().parent.parent
@@ -29,11 +32,11 @@ icon_path = os.path.join(project_root, "assets", "icons", "land-layers.png")
 if not Path(icon_path).exists():
     icon_path = "assets/icons/land-layers.png"
 
-logging.debug(f"Resolved icon path: {icon_path}")
+log.debug(f"Resolved icon path: {icon_path}")
 
 # Main application entry point
 def main():
-    logging.debug("Starting Application")
+    log.debug("Starting Application")
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(icon_path))
     
@@ -44,10 +47,10 @@ def main():
     app.setApplicationDisplayName("Platmap Pro")
 
     # Show main window
-    logging.debug("Creating main window")
+    log.debug("Creating main window")
     window = MainWindow()
     window.show()
-    logging.debug("Main window open")
+    log.debug("Main window open")
 
     sys.exit(app.exec())
 
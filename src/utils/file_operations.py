@@ -1,7 +1,11 @@
 import os
 import logging
+import xml.etree.ElementTree as ET
+import numpy as np
 import pandas as pd
-import geopandas as gpd
+import pyogrio
+import shapely
+from pyproj import Transformer
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -12,27 +16,33 @@ def read_geojson_files(file_paths):
         return None
 
     try:
-        gdfs = [gpd.read_file(file) for file in file_paths]
-        combined_gdf = gpd.GeoDataFrame(pd.concat(gdfs, ignore_index=True))
+        # pyogrio reads GeoJSON through GDAL's C path, far faster than the
+        # default fiona driver, and concat of GeoDataFrames keeps the type
+        gdfs = [pyogrio.read_dataframe(file) for file in file_paths]
+        combined_gdf = pd.concat(gdfs, ignore_index=True)
         if combined_gdf.crs is None:
             combined_gdf.set_crs("EPSG:4326", inplace=True)
-        return combined_gdf.to_crs("EPSG:3857")
+
+        # Reproject all vertices in one vectorized transformer call instead
+        # of geopandas' per-geometry to_crs path
+        transformer = Transformer.from_crs(combined_gdf.crs, "EPSG:3857", always_xy=True)
+        geoms = combined_gdf.geometry.values.copy()
+        coords = shapely.get_coordinates(geoms)
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        combined_gdf.geometry = shapely.set_coordinates(geoms, np.column_stack([xs, ys]))
+        return combined_gdf.set_crs("EPSG:3857", allow_override=True)
     except Exception as e:
         logging.error(f"Error reading GeoJSON files: {e}")
         return None
 
 def save_svg(svg_element, output_file):
     """Save an XML Element as an SVG file with pretty formatting."""
-    import xml.dom.minidom as minidom
-    import xml.etree.ElementTree as ET
-
-    xml_str = ET.tostring(svg_element, encoding="utf-8")
-    parsed_xml = minidom.parseString(xml_str)
-    pretty_xml = parsed_xml.toprettyxml(indent="  ")
-
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(pretty_xml)
+        # Indent in place and write once; avoids the serialize/minidom
+        # reparse/toprettyxml triple pass over the document
+        tree = ET.ElementTree(svg_element)
+        ET.indent(tree, space="  ")
+        tree.write(output_file, encoding="utf-8", xml_declaration=True)
         logging.info(f"SVG saved to {output_file}")
     except Exception as e:
         logging.error(f"Failed to save SVG: {e}")
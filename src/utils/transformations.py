@@ -1,5 +1,31 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy broadcasting covers arrays
+    njit = None
+
+
 def transform_coords(x, y, minx, miny, scale, maxy, x_padding, y_padding):
-    """Transform coordinates with scaling, centering, and flipping Y-axis for SVG."""
+    """Transform coordinates with scaling, centering, and flipping Y-axis for SVG.
+
+    Broadcasts unchanged over NumPy arrays as well as scalars.
+    """
     scaled_x = (x - minx) * scale + x_padding
     scaled_y = (maxy - y) * scale + y_padding
     return scaled_x, scaled_y
+
+
+if njit is not None:
+    # Compiled scalar variant for callers that stay in per-point loops
+    _transform_coords_scalar = njit(cache=True, fastmath=True)(transform_coords)
+else:
+    _transform_coords_scalar = transform_coords
+
+
+def transform_coords_array(xy, minx, miny, scale, maxy, x_padding, y_padding):
+    """Transform an (N, 2) coordinate array in one fused vector expression."""
+    out = np.empty_like(xy, dtype=np.float64)
+    out[:, 0] = (xy[:, 0] - minx) * scale + x_padding
+    out[:, 1] = (maxy - xy[:, 1]) * scale + y_padding
+    return out